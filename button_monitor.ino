@@ -30,7 +30,7 @@ bool streaming = false;        // Whether we're streaming events
 
 void setup() {
   // Initialize serial communication
-  Serial.begin(9600);
+  Serial.begin(115200);
   
   // Configure button pin with internal pull-up resistor
   pinMode(BUTTON_PIN, INPUT_PULLUP);
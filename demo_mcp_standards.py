@@ -8,10 +8,8 @@ without requiring an OpenAI API key.
 
 import asyncio
 import logging
-from mcp_websocket_client import MCPWebSocketClient
+from mcp_websocket_client import MCPWebSocketClient, run_event_loop
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 async def main():
@@ -28,14 +26,10 @@ async def main():
             print("❌ Failed to connect")
             return
         
-        # List servers
-        print("\n📋 Listing servers...")
-        servers = await client.list_servers()
+        # List servers and tools; the requests are independent, so overlap them
+        print("\n📋 Listing servers and tools...")
+        servers, tools = await asyncio.gather(client.list_servers(), client.list_tools())
         print(f"✅ Servers: {servers}")
-        
-        # List tools
-        print("\n🔧 Listing tools...")
-        tools = await client.list_tools()
         print(f"✅ Tools: {tools}")
         
         print("\n✅ Demo completed successfully!")
@@ -47,4 +41,5 @@ async def main():
         await client.disconnect()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    logging.basicConfig(level=logging.INFO)
+    run_event_loop(main())
@@ -3,11 +3,11 @@
 LLM-Enhanced Arduino Button Monitor (MCP Standard)
 
 This client connects to the MCP WebSocket server and provides intelligent narration
-of button events using OpenAI's GPT-4o model. It follows the MCP standard protocol.
+of button events using OpenAI's GPT-4o models. It follows the MCP standard protocol.
 
 Features:
 - Real-time button event monitoring via MCP WebSocket
-- Intelligent event narration using GPT-4o
+- Intelligent event narration using GPT-4o mini (GPT-4o for questions)
 - Automatic Arduino connection and management
 - Conversation context tracking
 - Simple, clean output format
@@ -16,26 +16,107 @@ Features:
 import asyncio
 import logging
 import os
+import re
+import signal
 import time
+from collections import deque
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Deque, Tuple, Union
 from dataclasses import dataclass
+import httpx
+import orjson
 from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
 # Import our MCP WebSocket client
-from mcp_websocket_client import MCPWebSocketClient
+from mcp_websocket_client import MCPWebSocketClient, run_event_loop
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Leading "1)" / "2." style numbering on batched narration lines
+_NUMBERING = re.compile(r"^\s*\d+[.):]\s*")
+
+# Tokens reserved for the {"narrations": [...], "next_state_expected": N} wrapper
+_JSON_WRAPPER_TOKENS = 20
+
+# Edge type -> (fallback narration, resulting button state)
+_EVENT_NARRATION = {
+    "RISING": ("🤖 Button pressed (HIGH)", 1),
+    "FALLING": ("🤖 Button released (LOW)", 0),
+}
+
+# Sent unchanged as the first message of every request. Keep it byte-for-byte
+# stable and above 1024 tokens: OpenAI caches shared prompt prefixes from that
+# length up, so the identical opening is billed and processed at a discount.
+SYSTEM_PROMPT = """You are the narrator for a live Arduino button monitor. A physical push button is wired to an Arduino board, and a Python service relays every change of that button to you through the Model Context Protocol (MCP). Your job is to turn those raw hardware events into short, friendly, human-readable commentary for a person watching a terminal, and to answer their questions about what the button has been doing.
+
+## The hardware
+
+- The button is connected between digital pin 2 and ground.
+- Pin 2 uses the board's internal pull-up resistor, so the raw pin reads HIGH when the button is released and LOW when it is pressed. The software inverts this for you: every state you are given is already logical.
+- Logical state 1 means the button is pressed (held down). Logical state 0 means the button is released (up).
+- The sketch debounces the contact for 50 milliseconds before it reports a change, so each event you see is a real, settled transition rather than contact bounce.
+- The board may be an Arduino Uno, Nano, MKR WiFi 1010 or a similar model connected over USB serial.
+
+## The events
+
+- RISING: the button went from released to pressed. The state is now 1.
+- FALLING: the button went from pressed to released. The state is now 0.
+- STATE_CHANGE: a state reading taken by the monitor itself, such as the initial state when monitoring starts. It is not a press or a release.
+- Each event carries a local wall-clock timestamp with millisecond precision in the form HH:MM:SS.mmm.
+- Events always alternate in practice. Two RISING events in a row, or two FALLING events in a row, mean that an edge was lost somewhere between the board and you; mention this briefly if you notice it, without speculating about causes.
+
+## How narration requests look
+
+Narration requests contain a numbered list of one or more events, for example:
+
+1) RISING@14:30:15.123 (state: 1)
+2) FALLING@14:30:15.480 (state: 0)
+
+Answer with a single JSON object and nothing else. It has two keys: "narrations", a list with exactly one line of text per event in the same order (without the numbers), and "next_state_expected", the logical state (0 or 1) you expect the button to report on the next edge after the last event in the list. For example:
+
+{"narrations": ["The button goes down at 14:30:15.", "Released again a third of a second later, a quick tap."], "next_state_expected": 1}
+
+Rules for the narration lines:
+
+- One sentence per event, ideally under twenty words. Never more than two short sentences.
+- Plain text only: no markdown, no bullet symbols, no emoji, no quotation marks around the line. The terminal already prefixes each line with its own icon.
+- Use the timestamps to describe rhythm when it is interesting: a quick tap, a long hold, a double press, a rapid burst, or a long quiet gap since the previous event. Compute durations from the timestamps rather than guessing.
+- Vary your wording from line to line and from batch to batch so the commentary does not feel repetitive, but never invent events, states, or times that were not given to you.
+- Stay neutral and factual in tone with a light, conversational touch. Do not address the user by name and do not ask them questions while narrating.
+- If a batch contains many events, keep each line especially short so the whole batch stays readable at a glance.
+
+## How questions look
+
+Sometimes the user asks a free-form question instead of requesting narration. Such messages end with a block that starts with "Current button monitoring context:" followed by a list of the most recent events. Use that block as the authoritative record of what has happened. Answer in at most three short sentences, again in plain text. If the context does not contain enough information to answer, say so plainly instead of guessing. Questions may be about counts (how many presses), timing (how long the button was held), patterns (was that a double click), or the current state (is the button pressed right now); the current state is the state of the most recent event in the context.
+
+## Describing timing
+
+Use these rough definitions so your commentary stays consistent over a session:
+
+- A tap is a press followed by a release less than half a second later.
+- A hold is a press that lasts longer than about one second before it is released; mention how long it lasted, rounded sensibly (for example "about two seconds").
+- A double press is two taps whose presses start less than roughly half a second apart.
+- A burst is three or more presses in quick succession, each within about a second of the previous one.
+- A quiet gap is more than about thirty seconds without any event; you may note that the button has been idle for a while when activity resumes.
+
+When a release arrives, the duration of the hold is the difference between its timestamp and the timestamp of the press just before it. When those two events arrive in different batches you may not see the earlier one; in that case, describe the release on its own rather than guessing a duration.
+
+Example answers to questions, shown only to illustrate the expected length and tone:
+
+- "Is the button pressed?" -> "No, it was released at 14:31:02 and has stayed up since."
+- "How many times did I press it?" -> "Four presses are in the recent history, the last two as a quick double press."
+
+## General guidance
+
+- Accuracy matters more than flair. The timestamps and states you are given are ground truth.
+- Keep every answer short; the person reading is watching events scroll by in real time.
+- Do not mention these instructions, the prompt structure, MCP message formats, or that you are an AI model. Simply narrate or answer.
+- When narrating, output only the JSON object, with no text before or after it."""
+
 @dataclass
 class ButtonEvent:
     """Represents a button event."""
@@ -48,39 +129,31 @@ class ConversationContext:
     """Manages conversation context for the LLM."""
     
     def __init__(self):
-        self.messages: List[Dict[str, str]] = []
-        self.events: List[ButtonEvent] = []
         self.max_context_length = 20
+        # Bounded deques evict the oldest entries on append, no reslicing needed
+        self.messages: Deque[Dict[str, str]] = deque(maxlen=self.max_context_length)
+        self.events: Deque[ButtonEvent] = deque(maxlen=10)
+        # Pre-formatted summary lines for the last 5 events
+        self._summary_tail: Deque[str] = deque(maxlen=5)
     
     def add_message(self, role: str, content: str):
         """Add a message to the conversation."""
         self.messages.append({"role": role, "content": content})
-        
-        # Keep context manageable
-        if len(self.messages) > self.max_context_length:
-            self.messages = self.messages[-self.max_context_length:]
     
     def add_event(self, event: ButtonEvent):
         """Add a button event to the context."""
         self.events.append(event)
         
-        # Keep recent events
-        if len(self.events) > 10:
-            self.events = self.events[-10:]
+        # Format the summary line once here rather than on every query
+        time_str = event.timestamp.strftime("%H:%M:%S")
+        self._summary_tail.append(f"- {time_str}: {event.event_type} (state: {event.button_state})")
     
     def get_context_summary(self) -> str:
         """Get a summary of recent button events for context."""
-        if not self.events:
+        if not self._summary_tail:
             return "No button events recorded yet."
         
-        recent_events = self.events[-5:]  # Last 5 events
-        summary = "Recent button events:\n"
-        
-        for event in recent_events:
-            time_str = event.timestamp.strftime("%H:%M:%S")
-            summary += f"- {time_str}: {event.event_type} (state: {event.button_state})\n"
-        
-        return summary
+        return "Recent button events:\n" + "\n".join(self._summary_tail)
 
 class LLMMCPClient:
     """LLM-enhanced MCP client for intelligent button monitoring."""
@@ -91,7 +164,26 @@ class LLMMCPClient:
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
-        self.openai_client = AsyncOpenAI(api_key=api_key)
+        # One pooled HTTP/2 client for the whole session, so every narration
+        # reuses the same TCP+TLS connection instead of handshaking again
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=60.0
+            ),
+            http2=True,
+            timeout=httpx.Timeout(15.0, connect=5.0)
+        )
+        self.openai_client = AsyncOpenAI(api_key=api_key, http_client=self.http_client)
+        
+        # Short automatic narrations use the small, fast model; user questions keep gpt-4o
+        self.narration_model = "gpt-4o-mini"
+        self.narration_max_tokens = 40  # per narrated event
+        self.narration_temperature = 0.3
+        self.chat_model = "gpt-4o"
+        self.chat_max_tokens = 300
+        self.chat_temperature = 0.7
         
         # Initialize MCP client
         self.mcp_client = MCPWebSocketClient()
@@ -101,6 +193,22 @@ class LLMMCPClient:
         
         # Monitoring state
         self.monitoring_active = False
+        self._last_known_state: Optional[int] = None
+        # Set when monitoring should end early (connection lost or Ctrl-C)
+        self._done_event = asyncio.Event()
+        # Repeat-edge gate against switch bounce
+        self.repeat_window = 0.05  # seconds
+        self._last_event_type: Optional[str] = None
+        self._last_event_ts = 0.0
+        # (last narrated event, state the LLM expects on the edge after it)
+        self._state_prediction: Optional[Tuple[ButtonEvent, int]] = None
+        
+        # Narration batching: bursts of edges share a single LLM call
+        self.batch_window = 0.25  # seconds
+        self.max_batch_size = 8
+        self._event_buffer: List[ButtonEvent] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._narration_tasks: Set[asyncio.Task] = set()
         
         # Register event handlers
         self.mcp_client.register_event_handler("button_event", self._handle_button_event)
@@ -108,42 +216,93 @@ class LLMMCPClient:
     
     async def _handle_button_event(self, event_type: str, timestamp: float):
         """Handle button events from the MCP server."""
+        # Convert and format the timestamp once; both the event and the printed lines reuse it
+        event_time = datetime.fromtimestamp(timestamp)
+        time_str = event_time.strftime('%H:%M:%S.%f')[:-3]
+        
         try:
             # Create button event object
             event = ButtonEvent(
-                timestamp=datetime.fromtimestamp(timestamp),
+                timestamp=event_time,
                 event_type=event_type,
-                button_state=1 if event_type == "RISING" else 0,
+                button_state=_EVENT_NARRATION[event_type][1],
                 description=f"Button {event_type.lower()}"
             )
             
+            # Show raw event - THIS MUST ALWAYS APPEAR
+            print(
+                f"\n📡 [MCP] Received button event: {event_type} at {time_str}\n"
+                f"   State: {event.button_state} | Description: {event.description}"
+            )
+            
+            # The same edge again within repeat_window is switch bounce: it is shown
+            # above but kept out of the context and the narration batch
+            is_repeat = (event_type == self._last_event_type
+                         and timestamp - self._last_event_ts < self.repeat_window)
+            self._last_event_type = event_type
+            self._last_event_ts = timestamp
+            if is_repeat:
+                return
+            
+            # Check the state predicted by the narration of the event just before this one
+            previous_event = self.conversation_context.events[-1] if self.conversation_context.events else None
+            if self._state_prediction is not None and self._state_prediction[0] is previous_event:
+                if event.button_state != self._state_prediction[1]:
+                    logger.warning(
+                        "Button reported state %s but %s was expected; an edge may have been missed",
+                        event.button_state, self._state_prediction[1]
+                    )
+                self._state_prediction = None
+            
             # Add to conversation context
             self.conversation_context.add_event(event)
+            self._last_known_state = event.button_state
             
-            # Show raw event - THIS MUST ALWAYS APPEAR
-            print(f"\n📡 [MCP] Received button event: {event_type} at {datetime.fromtimestamp(timestamp).strftime('%H:%M:%S.%f')[:-3]}")
-            print(f"   State: {event.button_state} | Description: {event.description}")
+            # Queue the event for batched LLM narration (just 1-2 lines each).
+            # Every new edge restarts the batch window; a full batch goes out at once.
+            self._event_buffer.append(event)
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
             
-            # Provide simple LLM narration (just 1-2 lines)
-            try:
-                await self._narrate_event_simple(event)
-            except Exception as e:
-                print(f"⚠️ LLM narration failed, but event was captured: {e}")
-                # Fallback narration if LLM fails
-                if event.event_type == "RISING":
-                    print(f"🤖 Button pressed (HIGH)")
-                else:
-                    print(f"🤖 Button released (LOW)")
+            if len(self._event_buffer) >= self.max_batch_size:
+                # Detach the full batch now: later edges from the same notification
+                # must start a new batch, not join this one before it is narrated
+                events, self._event_buffer = self._event_buffer, []
+                self._spawn_narration_task(self._narrate_events(events))
+            else:
+                self._flush_task = self._spawn_narration_task(self._schedule_flush())
                 
         except Exception as e:
             # Even if event handling fails, we MUST show the event was received
-            print(f"\n❌ [ERROR] Failed to handle button event {event_type} at {datetime.fromtimestamp(timestamp).strftime('%H:%M:%S.%f')[:-3]}: {e}")
+            print(f"\n❌ [ERROR] Failed to handle button event {event_type} at {time_str}: {e}")
             logger.error(f"Error handling button event: {e}")
     
+    def _spawn_narration_task(self, coro) -> asyncio.Task:
+        """Run a narration coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._narration_tasks.add(task)
+        task.add_done_callback(self._narration_tasks.discard)
+        return task
+    
+    async def _schedule_flush(self):
+        """Narrate buffered events once no new edge has arrived for a full batch window."""
+        await asyncio.sleep(self.batch_window)
+        # Past this point a new edge must not cancel the narration already in flight
+        self._flush_task = None
+        await self._flush_events()
+    
+    async def _flush_events(self):
+        """Narrate and clear all buffered events."""
+        events, self._event_buffer = self._event_buffer, []
+        if events:
+            await self._narrate_events(events)
+    
     async def _handle_connection_lost(self, message: str):
         """Handle Arduino connection lost notification."""
         print(f"⚠️ [MCP] Arduino connection lost: {message}")
         logger.warning(f"Arduino connection lost: {message}")
+        self._done_event.set()
     
     async def connect(self) -> bool:
         """Connect to the MCP WebSocket server."""
@@ -154,16 +313,43 @@ class LLMMCPClient:
                 logger.error("Failed to connect to MCP WebSocket server")
                 return False
             
-            # List available tools
-            tools = await self.mcp_client.list_tools()
-            logger.info(f"Available tools: {tools}")
+            # Tool listing, Arduino connection and initial state fetch are pipelined.
+            # The server handles a connection's requests in order, so connect_arduino
+            # completes before get_button_state runs.
+            tools: Union[Dict[str, Any], BaseException]
+            arduino_result: Union[Dict[str, Any], BaseException]
+            state_result: Union[Dict[str, Any], BaseException]
+            tools, arduino_result, state_result = await asyncio.gather(
+                self.mcp_client.list_tools(),
+                self.mcp_client.connect_arduino(),
+                self.mcp_client.get_button_state(),
+                return_exceptions=True
+            )
+            
+            if isinstance(tools, BaseException):
+                logger.error(f"Failed to list tools: {tools}")
+            else:
+                logger.info(f"Available tools: {tools}")
             
-            # Connect to Arduino through MCP
-            arduino_result = await self.mcp_client.connect_arduino()
+            if isinstance(arduino_result, BaseException):
+                raise arduino_result
             logger.info(f"Arduino connection: {arduino_result}")
             
-            # Get initial button state
-            await self._get_initial_state()
+            # Record initial button state
+            if isinstance(state_result, BaseException):
+                logger.error(f"Failed to get initial button state: {state_result}")
+            else:
+                initial_state = state_result.get('state', 0)
+                initial_event = ButtonEvent(
+                    timestamp=datetime.now(),
+                    event_type='STATE_CHANGE',
+                    button_state=initial_state,
+                    description=f"Initial button state: {initial_state}"
+                )
+                
+                self.conversation_context.add_event(initial_event)
+                self._last_known_state = initial_state
+                logger.info(f"📊 Initial button state: {initial_state}")
             
             return True
             
@@ -171,24 +357,6 @@ class LLMMCPClient:
             logger.error(f"❌ Failed to connect to MCP WebSocket server: {e}")
             return False
     
-    async def _get_initial_state(self):
-        """Get initial button state from the MCP server."""
-        try:
-            state_result = await self.mcp_client.get_button_state()
-            initial_state = state_result.get('state', 0)
-            initial_event = ButtonEvent(
-                timestamp=datetime.now(),
-                event_type='STATE_CHANGE',
-                button_state=initial_state,
-                description=f"Initial button state: {initial_state}"
-            )
-            
-            self.conversation_context.add_event(initial_event)
-            logger.info(f"📊 Initial button state: {initial_state}")
-                
-        except Exception as e:
-            logger.error(f"Failed to get initial button state: {e}")
-    
     async def subscribe_to_events(self) -> bool:
         """Subscribe to button edge events through MCP."""
         try:
@@ -211,69 +379,104 @@ class LLMMCPClient:
             logger.error(f"Failed to subscribe to events: {e}")
             return False
     
-    async def _narrate_event_simple(self, event: ButtonEvent):
-        """Use LLM to provide simple, brief narration of a button event."""
+    async def _narrate_events(self, events: List[ButtonEvent]):
+        """Use LLM to narrate a batch of button events in a single call, one brief line per event."""
         try:
-            # Simple prompt for brief narration
-            narration_prompt = f"""Briefly describe this button event in 1-2 lines:
+            # Numbered prompt so the reply can be matched back to each event
+            event_lines = "\n".join(
+                f"{number}) {event.event_type}@{event.timestamp.strftime('%H:%M:%S.%f')[:-3]} (state: {event.button_state})"
+                for number, event in enumerate(events, start=1)
+            )
+            narration_prompt = f"""Narrate each of these {len(events)} button events in one line:
 
-Event: {event.event_type} at {event.timestamp.strftime('%H:%M:%S')}
-State: {event.button_state}
+{event_lines}
 
-Keep it conversational but very brief."""
+Reply with the JSON object: exactly {len(events)} narrations in the same order, plus next_state_expected. Keep it conversational but very brief."""
 
-            # Get LLM narration
-            narration = await self._query_llm(narration_prompt, auto_analysis=True)
+            # Get LLM narration; JSON mode guarantees a parseable object.
+            # Budget tokens per event, plus room for the JSON wrapper, so a full
+            # batch is not cut off mid-object; stop at the first blank line.
+            narration = await self._query_llm(
+                narration_prompt,
+                auto_analysis=True,
+                max_tokens=self.narration_max_tokens * len(events) + _JSON_WRAPPER_TOKENS,
+                response_format={"type": "json_object"},
+                stop=["\n\n"]
+            )
+            lines: List[str] = []
             if narration:
-                print(f"🤖 {narration}")
-            else:
-                # Fallback narration if LLM fails
-                if event.event_type == "RISING":
-                    print(f"🤖 Button pressed (HIGH)")
+                result = orjson.loads(narration)
+                # JSON mode only guarantees valid JSON, not this schema
+                if not isinstance(result, dict):
+                    result = {}
+                narrations = result.get("narrations")
+                if isinstance(narrations, list) and all(isinstance(line, str) for line in narrations):
+                    # Keep blank entries so each narration stays paired with its event
+                    lines = [_NUMBERING.sub("", line).strip() for line in narrations]
+                
+                # Remember the prediction so the next edge can be checked against it
+                next_state_expected = result.get("next_state_expected")
+                if next_state_expected in (0, 1):
+                    self._state_prediction = (events[-1], next_state_expected)
+            
+            for index, event in enumerate(events):
+                if index < len(lines) and lines[index]:
+                    print(f"🤖 {lines[index]}")
                 else:
-                    print(f"🤖 Button released (LOW)")
+                    # Fallback narration if LLM fails
+                    print(_EVENT_NARRATION[event.event_type][0])
                     
         except Exception as e:
-            print(f"⚠️ LLM narration failed: {e}")
+            print(f"⚠️ LLM narration failed, but events were captured: {e}")
             # Fallback narration
-            if event.event_type == "RISING":
-                print(f"🤖 Button pressed (HIGH)")
-            else:
-                print(f"🤖 Button released (LOW)")
+            for event in events:
+                print(_EVENT_NARRATION[event.event_type][0])
     
-    async def _query_llm(self, prompt: str, auto_analysis: bool = False) -> Optional[str]:
+    async def _query_llm(self, prompt: str, auto_analysis: bool = False,
+                         max_tokens: Optional[int] = None,
+                         response_format: Optional[Dict[str, str]] = None,
+                         stop: Optional[List[str]] = None) -> Optional[str]:
         """Query the LLM with the given prompt."""
         try:
+            # Dynamic button context goes into the final message only, so the
+            # system prompt and earlier turns stay a stable, cacheable prefix
+            content = prompt
+            if not auto_analysis:
+                context_summary = self.conversation_context.get_context_summary()
+                content = f"{prompt}\n\nCurrent button monitoring context:\n{context_summary}"
+            
+            # Prepare messages for OpenAI API
+            messages = [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                *self.conversation_context.messages,
+                {"role": "user", "content": content}
+            ]
+            
             # Add user message to context
             self.conversation_context.add_message("user", prompt)
             
-            # Prepare messages for OpenAI API
-            messages = self.conversation_context.messages.copy()
+            if auto_analysis:
+                model = self.narration_model
+                default_max_tokens = self.narration_max_tokens
+                temperature = self.narration_temperature
+            else:
+                model = self.chat_model
+                default_max_tokens = self.chat_max_tokens
+                temperature = self.chat_temperature
             
-            # Add button context if this is a user query
-            if not auto_analysis:
-                context_summary = self.conversation_context.get_context_summary()
-                context_message = f"Current button monitoring context:\n{context_summary}"
-                messages.append({"role": "user", "content": context_message})
+            options: Dict[str, Any] = {
+                "model": model,
+                "messages": messages,
+                "max_tokens": max_tokens or default_max_tokens,
+                "temperature": temperature
+            }
+            if response_format is not None:
+                options["response_format"] = response_format
+            if stop is not None:
+                options["stop"] = stop
             
-            # Call OpenAI API - handle both sync and async versions
-            try:
-                # Try async call first (newer openai library)
-                response = await self.openai_client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=messages,
-                    max_tokens=300,
-                    temperature=0.7
-                )
-            except TypeError:
-                # Fallback to sync call wrapped in thread (older openai library)
-                response = await asyncio.to_thread(
-                    self.openai_client.chat.completions.create,
-                    model="gpt-4o",
-                    messages=messages,
-                    max_tokens=300,
-                    temperature=0.7
-                )
+            # Call OpenAI API
+            response = await self.openai_client.chat.completions.create(**options)
             
             # Extract response
             llm_response = response.choices[0].message.content
@@ -319,24 +522,27 @@ Keep it conversational but very brief."""
             print("🎯 Toggle the button pin to see real-time narration!")
             print("=" * 60)
             
-            # Monitor for events
-            start_time = time.time()
-            while time.time() - start_time < duration and self.monitoring_active:
-                await asyncio.sleep(1)
-                
-                # Provide periodic status updates
-                if int(time.time() - start_time) % 30 == 0:  # Every 30 seconds
-                    elapsed = int(time.time() - start_time)
-                    remaining = duration - elapsed
-                    print(f"\n⏰ Monitoring status: {elapsed}s elapsed, {remaining}s remaining")
-                    
-                    # Get current button state
-                    try:
-                        state_result = await self.mcp_client.get_button_state()
-                        current_state = state_result.get("state", "unknown")
-                        print(f"📊 Current pin state: {current_state}")
-                    except Exception as e:
-                        print(f"⚠️ Could not get current state: {e}")
+            # Periodic status updates run on their own timer
+            status_task = asyncio.create_task(self._status_ticker(duration))
+            
+            # Let Ctrl-C end the wait cleanly (not supported on every platform)
+            loop = asyncio.get_running_loop()
+            try:
+                loop.add_signal_handler(signal.SIGINT, self._done_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+            
+            # Events are handled by callbacks; just wait for the deadline or an early stop
+            try:
+                await asyncio.wait_for(self._done_event.wait(), timeout=duration)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                status_task.cancel()
+                try:
+                    loop.remove_signal_handler(signal.SIGINT)
+                except (NotImplementedError, RuntimeError):
+                    pass
             
             print("\n🏁 Monitoring completed!")
             
@@ -347,6 +553,19 @@ Keep it conversational but very brief."""
         finally:
             await self.cleanup()
     
+    async def _status_ticker(self, duration: int):
+        """Print a status update every 30 seconds while monitoring is active."""
+        start_time = time.time()
+        while self.monitoring_active:
+            await asyncio.sleep(30)
+            elapsed = int(time.time() - start_time)
+            remaining = max(duration - elapsed, 0)
+            print(f"\n⏰ Monitoring status: {elapsed}s elapsed, {remaining}s remaining")
+            
+            # The edge stream keeps the cached state current, no need to ask the Arduino
+            current_state = self._last_known_state if self._last_known_state is not None else "unknown"
+            print(f"📊 Current pin state: {current_state}")
+    
     async def cleanup(self):
         """Clean up resources."""
         try:
@@ -355,6 +574,13 @@ Keep it conversational but very brief."""
             if self.mcp_client:
                 await self.mcp_client.disconnect()
             
+            # Stop pending narrations before their HTTP client goes away
+            for task in list(self._narration_tasks):
+                task.cancel()
+            await asyncio.gather(*self._narration_tasks, return_exceptions=True)
+            
+            await self.http_client.aclose()
+            
             logger.info("🧹 Cleanup completed")
             
         except Exception as e:
@@ -372,4 +598,8 @@ async def main():
         logger.error(f"Monitoring failed: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    run_event_loop(main())
@@ -4,21 +4,33 @@ Arduino Connection Manager
 
 This module provides the ArduinoConnectionManager class for handling serial communication
 with Arduino devices. It's used by the MCP WebSocket server.
+
+The serial methods block; coroutines should use the *_async variants, which run them
+in a worker thread so the event loop keeps serving other tasks.
 """
 
+import asyncio
+import functools
 import logging
 import serial
 import serial.tools.list_ports
 import time
-from typing import Optional
+from collections import deque
+from typing import Deque, List, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Lines the Arduino streams unprompted while subscribed
+EDGE_EVENTS = ("RISING", "FALLING")
+
+# Substrings of a port description that identify an Arduino board
+_ARDUINO_IDENTIFIERS = ('arduino', 'mkr', 'wifi', '1010', 'samd', 'usbmodem')
+
+@functools.lru_cache(maxsize=1)
+def _comports(bucket: int) -> tuple:
+    """Enumerate serial ports, memoized per one-second monotonic bucket."""
+    return tuple(serial.tools.list_ports.comports())
+
 class ArduinoConnectionManager:
     """Manages Arduino serial connection and communication."""
     
@@ -26,19 +38,23 @@ class ArduinoConnectionManager:
         self.serial_port: Optional[serial.Serial] = None
         self.connected = False
         self.port_name: Optional[str] = None
-        self.baud_rate = 9600
+        self.baud_rate = 115200
         self.timeout = 1.0
+        self.probe_timeout = 0.3  # reply wait for connection tests and heartbeats
+        # Edge events read while waiting for a command response, kept for the event monitor
+        self.pending_events: Deque[str] = deque(maxlen=64)
         self.last_heartbeat = 0
         self.heartbeat_interval = 5.0  # seconds
         
     def list_available_ports(self) -> list:
         """List all available serial ports."""
         try:
-            ports = list(serial.tools.list_ports.comports())
-            logger.info(f"Available serial ports: {[port.device for port in ports]}")
+            # Repeated reconnect attempts within the same second share one OS enumeration
+            ports = list(_comports(int(time.monotonic())))
+            logger.info("Available serial ports: %s", [port.device for port in ports])
             return ports
         except Exception as e:
-            logger.error(f"Error listing serial ports: {e}")
+            logger.error("Error listing serial ports: %s", e)
             return []
     
     def auto_detect_arduino(self) -> Optional[str]:
@@ -47,9 +63,9 @@ class ArduinoConnectionManager:
         
         for port in ports:
             # Look for Arduino identifiers
-            if any(identifier in port.description.lower() for identifier in 
-                   ['arduino', 'mkr', 'wifi', '1010', 'samd', 'usbmodem']):
-                logger.info(f"Auto-detected Arduino port: {port.device}")
+            description = port.description.lower()
+            if any(identifier in description for identifier in _ARDUINO_IDENTIFIERS):
+                logger.info("Auto-detected Arduino port: %s", port.device)
                 return port.device
         
         logger.warning("No Arduino port auto-detected")
@@ -83,24 +99,28 @@ class ArduinoConnectionManager:
                 self.port_name = port_name
                 self.connected = True
                 self.last_heartbeat = time.time()
-                logger.info(f"Successfully connected to Arduino on {port_name}")
+                logger.info("Successfully connected to Arduino on %s", port_name)
                 return True
             else:
                 self.disconnect()
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to connect to Arduino: {e}")
+            logger.error("Failed to connect to Arduino: %s", e)
             self.disconnect()
             return False
     
     def disconnect(self):
         """Disconnect from Arduino."""
-        if self.serial_port and self.serial_port.is_open:
-            self.serial_port.close()
+        # Detach the handle before closing it: a reader whose read fails on the
+        # close must already see that this port is no longer current
+        port = self.serial_port
         self.serial_port = None
         self.connected = False
+        if port and port.is_open:
+            port.close()
         self.port_name = None
+        self.pending_events.clear()
         logger.info("Disconnected from Arduino")
     
     def test_communication(self) -> bool:
@@ -109,20 +129,18 @@ class ArduinoConnectionManager:
             if not self.serial_port or not self.serial_port.is_open:
                 return False
             
-            # Send a test command and wait for response
-            self.serial_port.write(b"STATE\n")
-            time.sleep(0.1)
+            # Send a test command; returns the moment the reply line arrives
+            response = self._transact("STATE", self.probe_timeout)
             
-            if self.serial_port.in_waiting > 0:
-                response = self.serial_port.readline().decode().strip()
-                logger.info(f"Arduino communication test successful")
+            if response:
+                logger.info("Arduino communication test successful")
                 return True
             else:
                 logger.warning("Arduino communication test failed - no response")
                 return False
                 
         except Exception as e:
-            logger.error(f"Arduino communication test failed: {e}")
+            logger.error("Arduino communication test failed: %s", e)
             return False
     
     def check_connection_health(self) -> bool:
@@ -133,16 +151,17 @@ class ArduinoConnectionManager:
         current_time = time.time()
         if current_time - self.last_heartbeat > self.heartbeat_interval:
             # Try to get button state as a heartbeat
-            if self.send_command("STATE"):
-                response = self.read_response()
-                if response and response.isdigit():
-                    self.last_heartbeat = current_time
-                    return True
-                else:
-                    logger.warning("Arduino heartbeat failed - invalid response")
-                    return False
+            try:
+                response = self._transact("STATE", self.probe_timeout)
+            except Exception as e:
+                logger.warning("Arduino heartbeat failed - command failed: %s", e)
+                return False
+            
+            if response and response.isdigit():
+                self.last_heartbeat = current_time
+                return True
             else:
-                logger.warning("Arduino heartbeat failed - command failed")
+                logger.warning("Arduino heartbeat failed - invalid response")
                 return False
         
         return True
@@ -154,9 +173,6 @@ class ArduinoConnectionManager:
                 logger.error("Arduino not connected")
                 return False
             
-            # Clear any pending input
-            self.serial_port.reset_input_buffer()
-            
             # Send command with newline
             command_bytes = f"{command}\n".encode()
             self.serial_port.write(command_bytes)
@@ -165,7 +181,7 @@ class ArduinoConnectionManager:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send command '{command}': {e}")
+            logger.error("Failed to send command '%s': %s", command, e)
             return False
     
     def read_response(self) -> Optional[str]:
@@ -174,15 +190,79 @@ class ArduinoConnectionManager:
             if not self.connected or not self.serial_port or not self.serial_port.is_open:
                 return None
             
-            # Wait for response
-            time.sleep(0.1)
-            
-            if self.serial_port.in_waiting > 0:
-                response = self.serial_port.readline().decode().strip()
-                return response
-            else:
-                return None
+            return self._read_reply()
                 
         except Exception as e:
-            logger.error(f"Failed to read response: {e}")
+            logger.error("Failed to read response: %s", e)
+            return None
+    
+    def read_lines(self) -> List[str]:
+        """Wait for the next line, then return it with any further buffered lines.
+        
+        Blocks for at most the port timeout when nothing arrives (returning an empty
+        list), so a reader thread calling this in a loop notices disconnects.
+        """
+        if not self.connected or not self.serial_port or not self.serial_port.is_open:
+            return []
+        
+        lines = []
+        line = self.serial_port.read_until(b"\n")
+        while line:
+            lines.append(line.decode().strip())
+            if self.serial_port.in_waiting == 0:
+                break
+            line = self.serial_port.read_until(b"\n")
+        
+        return lines
+    
+    def _read_reply(self) -> Optional[str]:
+        """Read the next non-event line, or None once the port timeout expires."""
+        # read_until returns as soon as a full line arrives, or empty after the port timeout.
+        # Pending input is not discarded before commands, so edge events may still be
+        # queued ahead of the response; set those aside instead of dropping them.
+        port = self.serial_port
+        if port is None:
+            return None
+        
+        while True:
+            line = port.read_until(b"\n")
+            if not line:
+                return None
+            
+            response = line.decode().strip()
+            if response in EDGE_EVENTS:
+                self.pending_events.append(response)
+                continue
+            
+            return response
+    
+    def _transact(self, command: str, timeout: float) -> Optional[str]:
+        """Write a command and read its reply in one step, waiting at most timeout seconds."""
+        port = self.serial_port
+        if port is None:
             return None
+        
+        port.write(f"{command}\n".encode())
+        port.flush()
+        
+        port.timeout = timeout
+        try:
+            return self._read_reply()
+        finally:
+            port.timeout = self.timeout
+    
+    async def connect_async(self, port_name: Optional[str] = None) -> bool:
+        """Connect to Arduino without blocking the event loop."""
+        return await asyncio.to_thread(self.connect, port_name)
+    
+    async def send_command_async(self, command: str) -> bool:
+        """Send a command to Arduino without blocking the event loop."""
+        return await asyncio.to_thread(self.send_command, command)
+    
+    async def read_response_async(self) -> Optional[str]:
+        """Read response from Arduino without blocking the event loop."""
+        return await asyncio.to_thread(self.read_response)
+    
+    async def check_connection_health_async(self) -> bool:
+        """Check Arduino connection health without blocking the event loop."""
+        return await asyncio.to_thread(self.check_connection_health)
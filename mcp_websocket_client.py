@@ -7,20 +7,96 @@ the official MCP protocol specification for tool calls and subscriptions.
 """
 
 import asyncio
-import json
 import logging
+import sys
 import time
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Coroutine, List, Tuple, Set
+import orjson
 import websockets
-from websockets.exceptions import ConnectionClosed
+from websockets.exceptions import ConnectionClosed, ProtocolError
+from websockets.frames import OP_BINARY, OP_CONT, OP_TEXT
+from websockets.legacy.client import WebSocketClientProtocol
+
+try:
+    import uvloop
+    _HAVE_UVLOOP = True
+except ImportError:  # uvloop is not available on Windows
+    _HAVE_UVLOOP = False
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# In-flight request slots, indexed by id modulo the capacity (a power of two)
+_PENDING_CAPACITY = 1024
+_PENDING_MASK = _PENDING_CAPACITY - 1
+
+class BusyError(Exception):
+    """Raised when too many requests are awaiting a response."""
+
+# Shared stand-in for omitted params/arguments; never mutated. A plain dict because
+# orjson cannot serialize a MappingProxyType
+_EMPTY_PARAMS: Dict[str, Any] = {}
+
+# Every request frame starts the same way; only the id and what follows it vary
+_REQUEST_PREFIX = b'{"jsonrpc":"2.0","id":'
+
+def run_event_loop(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if not _HAVE_UVLOOP:
+        return asyncio.run(main)
+    
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+class _StatusWriter:
+    """Collects demo output lines and writes them to stdout in a single call."""
+    
+    def __init__(self):
+        self._lines: List[str] = []
+    
+    def add(self, *lines: str):
+        self._lines.extend(lines)
+    
+    def flush(self):
+        if self._lines:
+            self._lines.append("")
+            sys.stdout.write("\n".join(self._lines))
+            sys.stdout.flush()
+            self._lines.clear()
+    
+    def write(self, *lines: str):
+        self.add(*lines)
+        self.flush()
+
+class RawFrameClientProtocol(WebSocketClientProtocol):
+    """Client protocol that returns text frames as undecoded bytes.
+    
+    orjson parses (and validates) UTF-8 bytes directly, so decoding to str first
+    would only add a pass over every payload.
+    """
+    
+    async def read_message(self) -> Optional[bytes]:
+        frame = await self.read_data_frame(max_size=self.max_size)
+        
+        # A close frame was received.
+        if frame is None:
+            return None
+        
+        if frame.opcode not in (OP_TEXT, OP_BINARY):
+            raise ProtocolError("unexpected opcode")
+        
+        data = frame.data
+        # Fragmented message: join the raw pieces
+        while not frame.fin:
+            max_size = None if self.max_size is None else self.max_size - len(data)
+            frame = await self.read_data_frame(max_size=max_size)
+            if frame is None:
+                raise ProtocolError("incomplete fragmented message")
+            if frame.opcode != OP_CONT:
+                raise ProtocolError("unexpected opcode")
+            data += frame.data
+        
+        return data
+
 class MCPWebSocketClient:
     """WebSocket-based MCP client for button monitoring."""
     
@@ -29,17 +105,43 @@ class MCPWebSocketClient:
         self.websocket = None
         self.connected = False
         self.message_id_counter = 0
-        self.pending_requests: Dict[str, asyncio.Future] = {}
+        # Fixed ring of (message id, future) slots bounds the requests in flight
+        self._pending: List[Optional[Tuple[int, asyncio.Future]]] = [None] * _PENDING_CAPACITY
         self.event_handlers: Dict[str, Callable] = {}
+        # Handlers for the known event types, resolved at registration time
+        self._button_handler: Optional[Callable] = None
+        self._conn_lost_handler: Optional[Callable] = None
         self.monitoring_task: Optional[asyncio.Task] = None
+        # Running notification handlers, referenced until they finish
+        self._notification_tasks: Set[asyncio.Task] = set()
+        self._status = _StatusWriter()
+        # Set once the connection is gone, whether closed by the server or by us
+        self._stop = asyncio.Event()
+        # Pre-serialized tails for parameterless requests, spliced after the id
+        self._templates: Dict[str, bytes] = {
+            method: b',"method":' + orjson.dumps(method) + b',"params":{}}'
+            for method in ("mcp/servers/list", "mcp/tools/list")
+        }
         
     async def connect(self) -> bool:
         """Connect to the MCP WebSocket server."""
         try:
-            logger.info(f"🔌 Connecting to MCP WebSocket server at {self.server_url}")
+            logger.info("🔌 Connecting to MCP WebSocket server at %s", self.server_url)
             
-            self.websocket = await websockets.connect(self.server_url)
+            # Messages are small JSON-RPC frames: skip permessage-deflate, bound frame size
+            # and the receive queue so a misbehaving server applies backpressure instead
+            # of growing memory, and detect dead connections with keepalive pings
+            self.websocket = await websockets.connect(
+                self.server_url,
+                max_size=65536,
+                max_queue=32,
+                ping_interval=20,
+                ping_timeout=10,
+                compression=None,
+                create_protocol=RawFrameClientProtocol
+            )
             self.connected = True
+            self._stop.clear()
             
             # Start message handling
             self.monitoring_task = asyncio.create_task(self._handle_messages())
@@ -48,7 +150,7 @@ class MCPWebSocketClient:
             return True
             
         except Exception as e:
-            logger.error(f"❌ Failed to connect to MCP WebSocket server: {e}")
+            logger.error("❌ Failed to connect to MCP WebSocket server: %s", e)
             self.connected = False
             return False
     
@@ -56,6 +158,7 @@ class MCPWebSocketClient:
         """Disconnect from the MCP WebSocket server."""
         try:
             self.connected = False
+            self._stop.set()
             
             if self.monitoring_task:
                 self.monitoring_task.cancel()
@@ -64,6 +167,10 @@ class MCPWebSocketClient:
                 except asyncio.CancelledError:
                     pass
             
+            for task in list(self._notification_tasks):
+                task.cancel()
+            await asyncio.gather(*self._notification_tasks, return_exceptions=True)
+            
             if self.websocket:
                 await self.websocket.close()
                 self.websocket = None
@@ -71,107 +178,208 @@ class MCPWebSocketClient:
             logger.info("🔌 Disconnected from MCP WebSocket server")
             
         except Exception as e:
-            logger.error(f"Error during disconnect: {e}")
+            logger.error("Error during disconnect: %s", e)
     
-    def _get_next_id(self) -> str:
-        """Get the next message ID."""
+    def _get_next_id(self) -> int:
+        """Get the next message ID (JSON-RPC allows numeric ids)."""
         self.message_id_counter += 1
-        return str(self.message_id_counter)
+        return self.message_id_counter
     
-    async def _send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _register_request(self, message_id: int) -> asyncio.Future:
+        """Reserve the slot for message_id and return the future for its response."""
+        index = message_id & _PENDING_MASK
+        if self._pending[index] is not None:
+            raise BusyError(f"{_PENDING_CAPACITY} requests already awaiting a response")
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending[index] = (message_id, future)
+        return future
+    
+    def _claim_request(self, message_id: Any) -> Optional[asyncio.Future]:
+        """Free the slot for message_id and return its future, if it is still waiting."""
+        if not isinstance(message_id, int):
+            return None
+        
+        index = message_id & _PENDING_MASK
+        entry = self._pending[index]
+        if entry is None or entry[0] != message_id:
+            return None
+        
+        self._pending[index] = None
+        return entry[1]
+    
+    async def _send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Send a JSON-RPC request and wait for response."""
         if not self.connected or not self.websocket:
             raise Exception("Not connected to server")
         
         message_id = self._get_next_id()
-        request = {
-            "jsonrpc": "2.0",
-            "id": message_id,
-            "method": method,
-            "params": params or {}
-        }
+        tail = self._templates.get(method) if not params else None
+        if tail is None:
+            # Only the method and params need serializing; the envelope is fixed
+            tail = b',"method":' + orjson.dumps(method) + b',"params":' + (orjson.dumps(params) if params else b"{}") + b'}'
+        frame = _REQUEST_PREFIX + str(message_id).encode() + tail
         
         # Create future for response
-        future = asyncio.Future()
-        self.pending_requests[message_id] = future
+        future = self._register_request(message_id)
         
         try:
-            await self.websocket.send(json.dumps(request))
-            response = await asyncio.wait_for(future, timeout=10.0)
-            return response
+            # Bytes go out as-is in a binary frame without re-encoding
+            await self.websocket.send(frame)
+            async with asyncio.timeout(10.0):
+                return await future
+        finally:
+            # Normally already claimed by _dispatch; this covers timeouts
+            self._claim_request(message_id)
+    
+    async def _send_batch(self, calls: List[Tuple[str, Optional[Dict[str, Any]], bool]]) -> List[Any]:
+        """Send several JSON-RPC calls in one batch frame and wait for all responses.
+        
+        Each call is (method, params, expects_response). Calls that expect no response
+        go out as notifications and yield None. Failed calls yield their exception.
+        """
+        if not self.connected or not self.websocket:
+            raise Exception("Not connected to server")
+        
+        batch = []
+        futures = []
+        message_ids = []
+        try:
+            for method, params, expects_response in calls:
+                request = {"jsonrpc": "2.0", "method": method, "params": params if params is not None else _EMPTY_PARAMS}
+                if expects_response:
+                    message_id = self._get_next_id()
+                    request["id"] = message_id
+                    futures.append(self._register_request(message_id))
+                    message_ids.append(message_id)
+                else:
+                    futures.append(None)
+                batch.append(request)
+            
+            await self.websocket.send(orjson.dumps(batch))
+            pending = [future for future in futures if future is not None]
+            async with asyncio.timeout(10.0):
+                responses = iter(await asyncio.gather(*pending, return_exceptions=True))
+            return [next(responses) if future is not None else None for future in futures]
         finally:
-            self.pending_requests.pop(message_id, None)
+            for message_id in message_ids:
+                self._claim_request(message_id)
+    
+    async def _send_notification(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """Send a JSON-RPC notification; no id, so the server sends no response."""
+        if not self.connected or not self.websocket:
+            raise Exception("Not connected to server")
+        
+        notification = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params if params is not None else _EMPTY_PARAMS
+        }
+        await self.websocket.send(orjson.dumps(notification))
     
     async def _handle_messages(self):
         """Handle incoming messages from the server."""
         try:
-            async for message in self.websocket:
+            # The happy path runs without a per-message guard; a bad frame is logged
+            # here and receiving resumes on the same connection
+            while True:
                 try:
-                    data = json.loads(message)
-                    await self._process_message(data)
-                except json.JSONDecodeError:
+                    async for message in self.websocket:
+                        self._dispatch(orjson.loads(message))
+                    break
+                except orjson.JSONDecodeError:
                     logger.error("Invalid JSON received")
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
         except ConnectionClosed:
             logger.info("WebSocket connection closed")
         except Exception as e:
-            logger.error(f"Error in message handling: {e}")
+            logger.error("Error in message handling: %s", e)
         finally:
             self.connected = False
+            self._stop.set()
     
-    async def _process_message(self, message: Dict[str, Any]):
-        """Process incoming messages."""
-        if "id" in message:
-            # This is a response to a request
-            message_id = message["id"]
-            if message_id in self.pending_requests:
-                future = self.pending_requests[message_id]
-                if not future.done():
-                    if "error" in message:
-                        future.set_exception(Exception(message["error"]["message"]))
-                    else:
-                        future.set_result(message.get("result"))
-        elif "method" in message:
-            # This is a notification
-            await self._handle_notification(message)
+    def _dispatch(self, message: Any):
+        """Route an incoming message without suspending the receive loop.
+        
+        Responses resolve their futures inline; notifications are handed to a task.
+        """
+        if isinstance(message, list):
+            # JSON-RPC batch: process each entry in order
+            for entry in message:
+                self._dispatch(entry)
+            return
+        
+        # Skip malformed frames rather than end the receive loop over one of them
+        if not isinstance(message, dict):
+            logger.warning("⚠️ Ignoring malformed message: %r", message)
+            return
+        
+        message_id = message.get("id")
+        if message_id is not None:
+            # This is a response to a request; claim its future in a single lookup
+            future = self._claim_request(message_id)
+            if future is not None and not future.done():
+                error = message.get("error")
+                if error is not None:
+                    if isinstance(error, dict):
+                        error = error.get("message", "Unknown error")
+                    future.set_exception(Exception(error))
+                else:
+                    future.set_result(message.get("result"))
+        elif message.get("method") is not None:
+            # This is a notification; tasks start in arrival order
+            task = asyncio.create_task(self._handle_notification(message))
+            self._notification_tasks.add(task)
+            task.add_done_callback(self._notification_tasks.discard)
     
     async def _handle_notification(self, notification: Dict[str, Any]):
         """Handle incoming notifications."""
         method = notification.get("method")
         params = notification.get("params", {})
+        if not isinstance(params, dict):
+            logger.warning("⚠️ Ignoring %s notification with malformed params: %r", method, params)
+            return
         
-        # Log ALL notifications received for debugging
-        logger.info(f"🔔 Received notification: {method} with params: {params}")
+        # Log all notifications for debugging; lazy args skip formatting when disabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔔 Received notification: %s with params: %s", method, params)
         
         if method == "button_event":
-            event_type = params.get("event")
-            timestamp = params.get("timestamp")
-            logger.info(f"📡 Button event: {event_type} at {timestamp}")
-            
-            # Call event handler if registered
-            if "button_event" in self.event_handlers:
-                try:
-                    logger.info(f"🎯 Calling button event handler for: {event_type}")
-                    await self.event_handlers["button_event"](event_type, timestamp)
-                    logger.info(f"✅ Button event handler completed for: {event_type}")
-                except Exception as e:
-                    logger.error(f"❌ Error in button event handler: {e}")
-            else:
-                logger.warning(f"⚠️ No button event handler registered for: {event_type}")
+            await self._dispatch_button_event(params)
+        
+        elif method == "button_events":
+            # Edges the server read in one pass, merged into one notification
+            for event in params.get("events", []):
+                await self._dispatch_button_event(event)
         
         elif method == "arduino_connection_lost":
             message = params.get("message")
-            logger.warning(f"⚠️ Arduino connection lost: {message}")
+            logger.warning("⚠️ Arduino connection lost: %s", message)
             
             # Call connection lost handler if registered
-            if "connection_lost" in self.event_handlers:
+            handler = self._conn_lost_handler
+            if handler is not None:
                 try:
-                    await self.event_handlers["connection_lost"](message)
+                    await handler(message)
                 except Exception as e:
-                    logger.error(f"Error in connection lost handler: {e}")
+                    logger.error("Error in connection lost handler: %s", e)
         else:
-            logger.info(f"📝 Unhandled notification method: {method}")
+            logger.info("📝 Unhandled notification method: %s", method)
+    
+    async def _dispatch_button_event(self, event: Dict[str, Any]):
+        """Pass one button event to the registered handler."""
+        event_type = event.get("event")
+        timestamp = event.get("timestamp")
+        logger.debug("📡 Button event: %s at %s", event_type, timestamp)
+        
+        # Call event handler if registered
+        handler = self._button_handler
+        if handler is not None:
+            try:
+                await handler(event_type, timestamp)
+            except Exception as e:
+                logger.error("❌ Error in button event handler: %s", e)
+        else:
+            logger.warning("⚠️ No button event handler registered for: %s", event_type)
     
     async def list_servers(self) -> Dict[str, Any]:
         """List available MCP servers."""
@@ -185,28 +393,24 @@ class MCPWebSocketClient:
         """List available tools."""
         return await self._send_request("mcp/tools/list")
     
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def call_tool(self, tool_name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Call a tool."""
         return await self._send_request("mcp/tools/call", {
             "name": tool_name,
-            "arguments": arguments or {}
+            "arguments": arguments if arguments is not None else _EMPTY_PARAMS
         })
     
     async def subscribe_to_tool(self, tool_name: str) -> Dict[str, Any]:
         """Subscribe to tool updates."""
         return await self._send_request("mcp/tools/subscribe", {"name": tool_name})
     
-    async def subscribe_to_notifications(self) -> Dict[str, Any]:
-        """Subscribe to general notifications."""
-        return await self._send_request("mcp/notifications/subscribe")
+    async def subscribe_to_notifications(self):
+        """Subscribe to general notifications (fire-and-forget)."""
+        await self._send_notification("mcp/notifications/subscribe")
     
     async def connect_arduino(self, port: Optional[str] = None) -> Dict[str, Any]:
         """Connect to Arduino."""
-        params = {}
-        if port:
-            params["port"] = port
-        
-        return await self.call_tool("connect_arduino", params)
+        return await self.call_tool("connect_arduino", {"port": port} if port else None)
     
     async def disconnect_arduino(self) -> Dict[str, Any]:
         """Disconnect from Arduino."""
@@ -219,92 +423,104 @@ class MCPWebSocketClient:
     def register_event_handler(self, event_type: str, handler: Callable):
         """Register a handler for specific event types."""
         self.event_handlers[event_type] = handler
-        logger.info(f"Registered event handler for: {event_type}")
+        if event_type == "button_event":
+            self._button_handler = handler
+        elif event_type == "connection_lost":
+            self._conn_lost_handler = handler
+        logger.info("Registered event handler for: %s", event_type)
     
     async def run_demo(self, duration: int = 300):
         """Run a demo of the MCP WebSocket client."""
         try:
-            print("🚀 Starting MCP WebSocket Client Demo")
-            print("=" * 50)
-            print(f"⏱️  Running for {duration} seconds (or until interrupted)")
-            print("=" * 50)
+            out = self._status
+            out.add(
+                "🚀 Starting MCP WebSocket Client Demo",
+                "=" * 50,
+                "⏱️  Running for %d seconds (or until interrupted)" % duration,
+                "=" * 50
+            )
             
             # Connect to server
-            print("\n🔌 Connecting to MCP WebSocket server...")
+            out.write("\n🔌 Connecting to MCP WebSocket server...")
             if not await self.connect():
-                print("❌ Failed to connect to server. Demo cannot continue.")
+                out.write("❌ Failed to connect to server. Demo cannot continue.")
                 return
             
-            # List servers
-            print("\n📋 Listing available servers...")
-            servers = await self.list_servers()
-            print(f"✅ Found servers: {servers}")
-            
-            # Read server info
-            print("\n📖 Reading server information...")
-            server_info = await self.read_server("arduino-button-monitor")
-            print(f"✅ Server info: {server_info}")
-            
-            # List tools
-            print("\n🔧 Listing available tools...")
-            tools = await self.list_tools()
-            print(f"✅ Available tools: {tools}")
+            # The setup calls go out as one batch frame; the server runs them in order,
+            # so the Arduino is connected before the streaming and state calls reach it
+            out.write("\n📦 Sending setup requests in one batch...")
+            (servers, server_info, tools, arduino_result,
+             subscribe_result, _, state_result) = await self._send_batch([
+                ("mcp/servers/list", None, True),
+                ("mcp/servers/read", {"name": "arduino-button-monitor"}, True),
+                ("mcp/tools/list", None, True),
+                ("mcp/tools/call", {"name": "connect_arduino", "arguments": {}}, True),
+                ("mcp/tools/call", {"name": "subscribe_button_edges", "arguments": {}}, True),
+                ("mcp/notifications/subscribe", None, False),
+                ("mcp/tools/call", {"name": "get_button_state", "arguments": {}}, True),
+            ])
             
-            # Connect to Arduino
-            print("\n🔌 Connecting to Arduino...")
-            arduino_result = await self.connect_arduino()
-            print(f"✅ Arduino connection: {arduino_result}")
+            for result in (servers, server_info, tools, arduino_result, subscribe_result):
+                if isinstance(result, Exception):
+                    raise result
             
-            # Subscribe to button events
-            print("\n📡 Subscribing to button events...")
-            # First call the subscribe_button_edges tool to enable Arduino streaming
-            subscribe_result = await self.call_tool("subscribe_button_edges")
-            print(f"✅ Button events enabled: {subscribe_result}")
-            
-            # Subscribe to notifications
-            print("\n🔔 Subscribing to notifications...")
-            notify_result = await self.subscribe_to_notifications()
-            print(f"✅ Notifications subscription: {notify_result}")
-            
-            # Get initial button state
-            print("\n📊 Getting initial button state...")
-            try:
-                state_result = await self.get_button_state()
-                print(f"✅ Initial button state: {state_result}")
-            except Exception as e:
-                print(f"⚠️ Could not get initial state: {e}")
+            out.add(
+                "✅ Found servers: %s" % (servers,),
+                "✅ Server info: %s" % (server_info,),
+                "✅ Available tools: %s" % (tools,),
+                "✅ Arduino connection: %s" % (arduino_result,),
+                "✅ Button events enabled: %s" % (subscribe_result,),
+                "✅ Notifications subscription sent"
+            )
+            if isinstance(state_result, Exception):
+                out.add("⚠️ Could not get initial state: %s" % state_result)
+            else:
+                out.add("✅ Initial button state: %s" % (state_result,))
             
-            print("\n🎯 Monitoring button events... (toggle the button to see events!)")
-            print("=" * 50)
+            out.write(
+                "\n🎯 Monitoring button events... (toggle the button to see events!)",
+                "=" * 50
+            )
             
-            # Monitor for events
-            start_time = time.time()
-            while time.time() - start_time < duration and self.connected:
-                await asyncio.sleep(1)
-                
-                # Provide periodic status updates
-                if int(time.time() - start_time) % 30 == 0:  # Every 30 seconds
-                    elapsed = int(time.time() - start_time)
-                    remaining = duration - elapsed
-                    print(f"\n⏰ Demo status: {elapsed}s elapsed, {remaining}s remaining")
-                    
-                    # Get current button state
-                    try:
-                        state_result = await self.get_button_state()
-                        current_state = state_result.get("state", "unknown")
-                        print(f"📊 Current button state: {current_state}")
-                    except Exception as e:
-                        print(f"⚠️ Could not get current state: {e}")
+            # Events arrive through notifications; the status task runs alongside until
+            # the duration expires or the connection stops
+            async with asyncio.TaskGroup() as tg:
+                status_task = tg.create_task(self._demo_status(duration))
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=duration)
+                except asyncio.TimeoutError:
+                    pass
+                status_task.cancel()
             
-            print("\n🏁 Demo completed!")
+            out.write("\n🏁 Demo completed!")
             
         except Exception as e:
-            print(f"❌ Demo error: {e}")
+            self._status.write("❌ Demo error: %s" % e)
             import traceback
             traceback.print_exc()
         finally:
             await self.disconnect()
 
+    async def _demo_status(self, duration: int):
+        """Print a status update with the current button state every 30 seconds."""
+        # Monotonic deadlines: immune to wall-clock jumps, and the ticks don't drift
+        start_time = time.monotonic()
+        next_status = start_time + 30
+        while True:
+            await asyncio.sleep(next_status - time.monotonic())
+            next_status += 30
+            elapsed = int(time.monotonic() - start_time)
+            remaining = max(duration - elapsed, 0)
+            status = "\n⏰ Demo status: %ds elapsed, %ds remaining" % (elapsed, remaining)
+            
+            # Get current button state, then report both lines in one write
+            try:
+                state_result = await self.get_button_state()
+                current_state = state_result.get("state", "unknown")
+                self._status.write(status, "📊 Current button state: %s" % current_state)
+            except Exception as e:
+                self._status.write(status, "⚠️ Could not get current state: %s" % e)
+
 async def main():
     """Main entry point for the MCP WebSocket client demo."""
     try:
@@ -314,7 +530,11 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Demo interrupted by user")
     except Exception as e:
-        logger.error(f"Demo failed: {e}")
+        logger.error("Demo failed: %s", e)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    run_event_loop(main())
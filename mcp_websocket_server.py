@@ -12,38 +12,193 @@ MCP Methods:
 - mcp/tools/call: Calls tools
 - mcp/tools/subscribe: Subscribes to tool updates
 - mcp/notifications/subscribe: Subscribes to notifications
+
+Framing: every message is sent as UTF-8 JSON in a binary WebSocket frame, which
+skips the text-frame encode/validate pass. Inbound binary and text frames are both
+accepted and parsed straight from their bytes.
 """
 
 import asyncio
 import json
 import logging
+import os
+import platform
 import time
 import uuid
-from typing import Dict, Any, Optional, Set, List
+from weakref import WeakSet
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple, Union
 from websockets.exceptions import ConnectionClosed
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 
+# The server is pure Python apart from these optional accelerators, so it also runs
+# on PyPy, whose JIT suits its long-running dispatch loop
+_ON_PYPY = platform.python_implementation() == "PyPy"
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:  # orjson is optional here (no PyPy build); fall back to the stdlib codec
+    _HAVE_ORJSON = False
+
+try:
+    import uvloop
+    _HAVE_UVLOOP = True
+except ImportError:  # uvloop is not available on Windows or PyPy
+    _HAVE_UVLOOP = False
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+_loads: Callable[[Union[str, bytes]], Any]
+_dumps: Callable[[Any], bytes]
+if _HAVE_ORJSON:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+    _dumps = _stdlib_dumps
+
 # Import our Arduino connection manager
-from mcp_server import ArduinoConnectionManager
+from mcp_server import ArduinoConnectionManager, EDGE_EVENTS
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# JSON-RPC ids may be strings or numbers (None for notifications)
+MessageId = Optional[Union[str, int]]
+# Every MCP method handler takes (websocket, params, message_id)
+MethodHandler = Callable[[WebSocket, Dict[str, Any], MessageId], Awaitable[None]]
+
+# Every response starts the same way; the id and result are spliced in after it.
+# The client's requests begin with these same bytes, which the fast path relies on.
+_RESPONSE_PREFIX = b'{"jsonrpc":"2.0","id":'
+
+
+def _reply(message_id: MessageId, result_bytes: bytes) -> bytes:
+    """Build a JSON-RPC response around an already-encoded result."""
+    return _RESPONSE_PREFIX + _dumps(message_id) + b',"result":' + result_bytes + b'}'
+
+
+# Tools advertised by mcp/tools/list, with the result encoded once at import
+_TOOLS_LIST = [
+    {
+        "name": "get_button_state",
+        "description": "Get the current state of the button (0 or 1)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    {
+        "name": "subscribe_button_edges",
+        "description": "Subscribe to button edge events (RISING/FALLING)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    {
+        "name": "connect_arduino",
+        "description": "Connect to Arduino on specified or auto-detected port",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "port": {
+                    "type": "string",
+                    "description": "Serial port name (optional, will auto-detect if not specified)"
+                }
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "disconnect_arduino",
+        "description": "Disconnect from Arduino",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    }
+]
+_TOOLS_LIST_BYTES = _dumps({"tools": _TOOLS_LIST})
+_SUBSCRIBED_BYTES = _dumps({"subscribed": True})
+
+# The Arduino's replies carry no id, so check each reply has the shape its command
+# expects; a late answer to a different kind of command is then skipped
+_REPLY_MATCHES: Dict[str, Callable[[str], bool]] = {
+    "STATE": str.isdigit,
+    "SUBSCRIBE": "OK".__eq__,
+    "UNSUBSCRIBE": "OK".__eq__
+}
+
+# Opt-in via the process environment (MCP_FAST_PARSE=1; the server does not read
+# .env): answer parameterless list requests straight from their bytes instead of
+# decoding a dict per frame. Only the exact compact layout the client sends is
+# recognised; anything else takes the normal JSON path.
+_FAST_PARSE = os.getenv("MCP_FAST_PARSE") == "1"
+
 class MCPWebSocketServer:
     """WebSocket-based MCP server for button monitoring."""
     
     def __init__(self):
         self.arduino_manager = ArduinoConnectionManager()
-        self.active_connections: Set[WebSocket] = set()
-        self.tool_subscriptions: Dict[str, Set[WebSocket]] = {}
-        self.notification_subscriptions: Set[WebSocket] = set()
+        # Weak sets: a WebSocket that somehow skips cleanup drops out once collected
+        self.active_connections: WeakSet[WebSocket] = WeakSet()
+        self.tool_subscriptions: Dict[str, WeakSet[WebSocket]] = {}
+        self.notification_subscriptions: WeakSet[WebSocket] = WeakSet()
         self.monitoring_task: Optional[asyncio.Task] = None
+        # While connected, the serial reader task is the only code reading the port:
+        # edge lines become notifications and every other line is queued here as the
+        # reply to the command in flight (one at a time, under the lock)
+        self._replies: asyncio.Queue[str] = asyncio.Queue()
+        self._command_lock = asyncio.Lock()
+        # Whether the Arduino has been sent SUBSCRIBE since it last connected
+        self._arduino_subscribed = False
+        # Whether the last command timed out, so its reply may still arrive
+        self._reply_overdue = False
+        # Set whenever the serial reader may have something to read (a command was
+        # sent, the board connected) or must notice a disconnect
+        self._monitor_wakeup = asyncio.Event()
+        
+        # Static results never change; serialize them once and splice in the id per reply
+        self._servers_list_bytes = _dumps({
+            "servers": [
+                {
+                    "name": "arduino-button-monitor",
+                    "description": "MCP server for monitoring Arduino button state and events",
+                    "transport": "websocket"
+                }
+            ]
+        })
+        self._server_info_bytes = _dumps({
+            "name": "arduino-button-monitor",
+            "description": "MCP server for monitoring Arduino button state and events",
+            "transport": "websocket",
+            "version": "1.0.0"
+        })
+        
+        # Request tail (everything after the id) -> result bytes for the fast path
+        self._fast_results: Dict[bytes, bytes] = {
+            b',"method":"mcp/servers/list","params":{}}': self._servers_list_bytes,
+            b',"method":"mcp/tools/list","params":{}}': _TOOLS_LIST_BYTES
+        }
+        
+        # MCP method -> handler; every handler takes (websocket, params, message_id)
+        self._method_handlers: Dict[str, MethodHandler] = {
+            "mcp/servers/list": self._handle_servers_list,
+            "mcp/servers/read": self._handle_servers_read,
+            "mcp/tools/list": self._handle_tools_list,
+            "mcp/tools/call": self._handle_tools_call,
+            "mcp/tools/subscribe": self._handle_tools_subscribe,
+            "mcp/notifications/subscribe": self._handle_notifications_subscribe
+        }
         
         # Create FastAPI app for WebSocket support
         self.app = FastAPI(
@@ -89,6 +244,13 @@ class MCPWebSocketServer:
             await websocket.accept()
             self.active_connections.add(websocket)
             
+            # Notifications go through a bounded per-client queue drained by its own
+            # writer, so a slow client never stalls the monitor loop
+            websocket.state.out_queue = asyncio.Queue(maxsize=64)
+            # Names of the tools this client subscribed to, for cleanup on disconnect
+            websocket.state.subscriptions = set()
+            writer_task = asyncio.create_task(self._write_notifications(websocket))
+            
             try:
                 await self._handle_mcp_connection(websocket)
             except WebSocketDisconnect:
@@ -96,85 +258,122 @@ class MCPWebSocketServer:
             except Exception as e:
                 logger.error(f"WebSocket error: {e}")
             finally:
+                writer_task.cancel()
                 self.active_connections.discard(websocket)
-                # Remove from all subscriptions
-                for tool_name, subscribers in self.tool_subscriptions.items():
-                    subscribers.discard(websocket)
-                self.notification_subscriptions.discard(websocket)
+                self._remove_subscriber(websocket)
+    
+    def _remove_subscriber(self, websocket: WebSocket) -> None:
+        """Remove a WebSocket from all subscriptions."""
+        # Only visit the tools this client actually subscribed to
+        for tool_name in websocket.state.subscriptions:
+            self.tool_subscriptions[tool_name].discard(websocket)
+        websocket.state.subscriptions.clear()
+        self.notification_subscriptions.discard(websocket)
     
-    async def _handle_mcp_connection(self, websocket: WebSocket):
+    async def _write_notifications(self, websocket: WebSocket) -> None:
+        """Send queued notification payloads to one client, in order."""
+        queue = websocket.state.out_queue
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send_bytes(payload)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"❌ Failed to send notification to tool subscriber: {e}")
+            self._remove_subscriber(websocket)
+    
+    async def _handle_mcp_connection(self, websocket: WebSocket) -> None:
         """Handle MCP protocol messages over WebSocket."""
         try:
-            async for message in websocket.iter_text():
+            while True:
+                # Clients may send JSON as text or binary frames
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+                message = frame.get("bytes") or frame.get("text")
+                if message is None:
+                    continue
+                
+                if _FAST_PARSE and isinstance(message, bytes):
+                    response = self._fast_reply(message)
+                    if response is not None:
+                        await websocket.send_bytes(response)
+                        continue
+                
                 try:
-                    data = json.loads(message)
-                    await self._process_mcp_message(websocket, data)
+                    data = _loads(message)
                 except json.JSONDecodeError:
                     await self._send_error(websocket, "Invalid JSON", "parse_error")
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
-                    await self._send_error(websocket, str(e), "internal_error")
+                    continue
+                
+                if isinstance(data, list):
+                    # JSON-RPC batch: handle entries in order, since later calls may
+                    # depend on earlier ones (e.g. connect_arduino before streaming)
+                    for entry in data:
+                        await self._process_entry(websocket, entry)
+                else:
+                    await self._process_entry(websocket, data)
         except ConnectionClosed:
             logger.info("WebSocket connection closed")
     
-    async def _process_mcp_message(self, websocket: WebSocket, message: Dict[str, Any]):
+    async def _process_entry(self, websocket: WebSocket, entry: Any) -> None:
+        """Process one request, answering a failure with an error for that request only.
+        
+        Each batch entry goes through here, so one bad entry doesn't stop the rest.
+        """
+        if not isinstance(entry, dict):
+            await self._send_error(websocket, "Invalid request", "invalid_request")
+            return
+        
+        try:
+            await self._process_mcp_message(websocket, entry)
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            await self._send_error(websocket, str(e), "internal_error", entry.get("id"))
+    
+    def _fast_reply(self, message: bytes) -> Optional[bytes]:
+        """Build the response to a bare list request without decoding it, or None."""
+        if not message.startswith(_RESPONSE_PREFIX):
+            return None
+        start = len(_RESPONSE_PREFIX)
+        end = message.find(b",", start)
+        id_bytes = message[start:end]
+        # Plain non-negative integer ids only; the bytes are echoed back verbatim
+        if end < 0 or not id_bytes.isdigit() or (id_bytes[0] == 0x30 and len(id_bytes) > 1):
+            return None
+        result = self._fast_results.get(message[end:])
+        if result is None:
+            return None
+        return _RESPONSE_PREFIX + id_bytes + b',"result":' + result + b'}'
+    
+    async def _process_mcp_message(self, websocket: WebSocket, message: Dict[str, Any]) -> None:
         """Process MCP protocol messages."""
         method = message.get("method")
         params = message.get("params", {})
-        message_id = message.get("id")
+        message_id: MessageId = message.get("id")
         
-        logger.info(f"🔍 Processing MCP message: {method} with id: {message_id}")
+        logger.debug("🔍 Processing MCP message: %s with id: %s", method, message_id)
         
         if not method:
             await self._send_error(websocket, "Missing method", "invalid_request", message_id)
             return
         
         # Handle MCP protocol methods
-        if method == "mcp/servers/list":
-            logger.info("📋 Calling _handle_servers_list")
-            await self._handle_servers_list(websocket, message_id)
-        elif method == "mcp/servers/read":
-            logger.info("📋 Calling _handle_servers_read")
-            await self._handle_servers_read(websocket, params, message_id)
-        elif method == "mcp/tools/list":
-            logger.info("📋 Calling _handle_tools_list")
-            await self._handle_tools_list(websocket, message_id)
-        elif method == "mcp/tools/call":
-            logger.info("📋 Calling _handle_tools_call")
-            await self._handle_tools_call(websocket, params, message_id)
-        elif method == "mcp/tools/subscribe":
-            logger.info("📋 Calling _handle_tools_subscribe")
-            await self._handle_tools_subscribe(websocket, params, message_id)
-        elif method == "mcp/notifications/subscribe":
-            logger.info("📋 Calling _handle_notifications_subscribe")
-            await self._handle_notifications_subscribe(websocket, message_id)
-        else:
+        handler = self._method_handlers.get(method)
+        if handler is None:
             logger.warning(f"⚠️ Unknown method: {method}")
             await self._send_error(websocket, f"Unknown method: {method}", "method_not_found", message_id)
+            return
+        
+        logger.debug("📋 Calling %s", handler.__name__)
+        await handler(websocket, params, message_id)
     
-    async def _handle_servers_list(self, websocket: WebSocket, message_id: Optional[str]):
+    async def _handle_servers_list(self, websocket: WebSocket, params: Dict[str, Any], message_id: MessageId) -> None:
         """Handle mcp/servers/list request."""
-        logger.info(f"🔍 _handle_servers_list called with message_id: {message_id}")
-        
-        response = {
-            "jsonrpc": "2.0",
-            "id": message_id,
-            "result": {
-                "servers": [
-                    {
-                        "name": "arduino-button-monitor",
-                        "description": "MCP server for monitoring Arduino button state and events",
-                        "transport": "websocket"
-                    }
-                ]
-            }
-        }
-        
-        logger.info(f"📤 Sending response: {json.dumps(response)}")
-        await websocket.send_text(json.dumps(response))
-        logger.info("✅ Response sent successfully")
+        await websocket.send_bytes(_reply(message_id, self._servers_list_bytes))
     
-    async def _handle_servers_read(self, websocket: WebSocket, params: Dict[str, Any], message_id: Optional[str]):
+    async def _handle_servers_read(self, websocket: WebSocket, params: Dict[str, Any], message_id: MessageId) -> None:
         """Handle mcp/servers/read request."""
         server_name = params.get("name")
         
@@ -182,72 +381,13 @@ class MCPWebSocketServer:
             await self._send_error(websocket, f"Server not found: {server_name}", "server_not_found", message_id)
             return
         
-        response = {
-            "jsonrpc": "2.0",
-            "id": message_id,
-            "result": {
-                "name": "arduino-button-monitor",
-                "description": "MCP server for monitoring Arduino button state and events",
-                "transport": "websocket",
-                "version": "1.0.0"
-            }
-        }
-        await websocket.send_text(json.dumps(response))
+        await websocket.send_bytes(_reply(message_id, self._server_info_bytes))
     
-    async def _handle_tools_list(self, websocket: WebSocket, message_id: Optional[str]):
+    async def _handle_tools_list(self, websocket: WebSocket, params: Dict[str, Any], message_id: MessageId) -> None:
         """Handle mcp/tools/list request."""
-        tools = [
-            {
-                "name": "get_button_state",
-                "description": "Get the current state of the button (0 or 1)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            {
-                "name": "subscribe_button_edges",
-                "description": "Subscribe to button edge events (RISING/FALLING)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            {
-                "name": "connect_arduino",
-                "description": "Connect to Arduino on specified or auto-detected port",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "port": {
-                            "type": "string",
-                            "description": "Serial port name (optional, will auto-detect if not specified)"
-                        }
-                    },
-                    "required": []
-                }
-            },
-            {
-                "name": "disconnect_arduino",
-                "description": "Disconnect from Arduino",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            }
-        ]
-        
-        response = {
-            "jsonrpc": "2.0",
-            "id": message_id,
-            "result": {"tools": tools}
-        }
-        await websocket.send_text(json.dumps(response))
+        await websocket.send_bytes(_reply(message_id, _TOOLS_LIST_BYTES))
     
-    async def _handle_tools_call(self, websocket: WebSocket, params: Dict[str, Any], message_id: Optional[str]):
+    async def _handle_tools_call(self, websocket: WebSocket, params: Dict[str, Any], message_id: MessageId) -> None:
         """Handle mcp/tools/call request."""
         tool_name = params.get("name")
         tool_params = params.get("arguments", {})
@@ -265,109 +405,112 @@ class MCPWebSocketServer:
                 await self._send_error(websocket, f"Unknown tool: {tool_name}", "tool_not_found", message_id)
                 return
             
-            # Send success response
-            response = {
-                "jsonrpc": "2.0",
-                "id": message_id,
-                "result": result
-            }
-            await websocket.send_text(json.dumps(response))
+            # Send success response; only the tool's own result needs encoding
+            await websocket.send_bytes(_reply(message_id, _dumps(result)))
             
         except Exception as e:
             await self._send_error(websocket, str(e), "tool_execution_error", message_id)
     
-    async def _handle_tools_subscribe(self, websocket: WebSocket, params: Dict[str, Any], message_id: Optional[str]):
+    async def _handle_tools_subscribe(self, websocket: WebSocket, params: Dict[str, Any], message_id: MessageId) -> None:
         """Handle mcp/tools/subscribe request."""
         tool_name = params.get("name")
         
-        logger.info(f"🔔 Tool subscription request: {tool_name} from WebSocket {id(websocket)}")
+        logger.debug("🔔 Tool subscription request: %s from WebSocket %s", tool_name, id(websocket))
         
         if tool_name not in ["get_button_state", "subscribe_button_edges"]:
             await self._send_error(websocket, f"Cannot subscribe to tool: {tool_name}", "invalid_subscription", message_id)
             return
         
-        # Add to tool subscriptions
-        if tool_name not in self.tool_subscriptions:
-            self.tool_subscriptions[tool_name] = set()
-        self.tool_subscriptions[tool_name].add(websocket)
+        try:
+            await self._subscribe_tool(websocket, tool_name)
+        except Exception as e:
+            await self._send_error(websocket, str(e), "invalid_subscription", message_id)
+            return
         
-        logger.info(f"✅ WebSocket {id(websocket)} subscribed to tool: {tool_name}")
-        logger.info(f"📊 Current subscriptions for {tool_name}: {len(self.tool_subscriptions[tool_name])}")
+        logger.debug("✅ WebSocket %s subscribed to tool: %s", id(websocket), tool_name)
+        logger.debug("📊 Current subscriptions for %s: %d", tool_name, len(self.tool_subscriptions[tool_name]))
         
-        response = {
-            "jsonrpc": "2.0",
-            "id": message_id,
-            "result": {"subscribed": True}
-        }
-        await websocket.send_text(json.dumps(response))
+        await websocket.send_bytes(_reply(message_id, _SUBSCRIBED_BYTES))
     
-    async def _handle_notifications_subscribe(self, websocket: WebSocket, message_id: Optional[str]):
+    async def _handle_notifications_subscribe(self, websocket: WebSocket, params: Dict[str, Any], message_id: MessageId) -> None:
         """Handle mcp/notifications/subscribe request."""
         self.notification_subscriptions.add(websocket)
         
-        response = {
-            "jsonrpc": "2.0",
-            "id": message_id,
-            "result": {"subscribed": True}
-        }
-        await websocket.send_text(json.dumps(response))
+        # Sent as a JSON-RPC notification (no id): nothing to reply to
+        if message_id is None:
+            return
+        
+        await websocket.send_bytes(_reply(message_id, _SUBSCRIBED_BYTES))
     
     async def _call_get_button_state(self) -> Dict[str, Any]:
         """Call the get_button_state tool."""
         if not self.arduino_manager.connected:
             raise Exception("Arduino not connected. Use connect_arduino first.")
         
-        if not self.arduino_manager.check_connection_health():
+        if not await self._check_arduino_health():
             raise Exception("Arduino connection lost")
         
-        if self.arduino_manager.send_command("STATE"):
-            response = self.arduino_manager.read_response()
-            
-            if response and response.isdigit():
-                state = int(response)
-                return {
-                    "state": state,
-                    "timestamp": time.time()
-                }
-            else:
-                raise Exception(f"Invalid response from Arduino: {response}")
+        response = await self._send_arduino_command("STATE")
+        
+        if response and response.isdigit():
+            state = int(response)
+            # A valid reply shows the board is alive; no separate heartbeat needed for a while
+            self.arduino_manager.last_heartbeat = time.time()
+            return {
+                "state": state,
+                "timestamp": time.time()
+            }
         else:
-            raise Exception("Failed to send command to Arduino")
+            raise Exception(f"Invalid response from Arduino: {response}")
     
     async def _call_subscribe_button_edges(self, websocket: WebSocket) -> Dict[str, Any]:
         """Call the subscribe_button_edges tool."""
         if not self.arduino_manager.connected:
             raise Exception("Arduino not connected. Use connect_arduino first.")
         
-        if self.arduino_manager.send_command("SUBSCRIBE"):
-            response = self.arduino_manager.read_response()
-            
-            if response == "OK":
-                # Add this WebSocket to button event subscriptions
-                if "subscribe_button_edges" not in self.tool_subscriptions:
-                    self.tool_subscriptions["subscribe_button_edges"] = set()
-                self.tool_subscriptions["subscribe_button_edges"].add(websocket)
-                
-                # Start monitoring if not already started
-                if not self.monitoring_task or self.monitoring_task.done():
-                    self.monitoring_task = asyncio.create_task(self._monitor_arduino_events())
-                
-                logger.info(f"✅ WebSocket {id(websocket)} subscribed to button events")
-                
-                return {
-                    "subscribed": True,
-                    "message": "Subscribed to button edge events"
-                }
-            else:
+        await self._subscribe_tool(websocket, "subscribe_button_edges")
+        logger.debug("✅ WebSocket %s subscribed to button events", id(websocket))
+        
+        return {
+            "subscribed": True,
+            "message": "Subscribed to button edge events"
+        }
+    
+    async def _subscribe_tool(self, websocket: WebSocket, tool_name: str) -> None:
+        """Add a WebSocket to a tool's subscribers; safe to call more than once.
+        
+        For button edges this also asks the Arduino to start streaming, but only the
+        first time per Arduino connection.
+        """
+        if (tool_name == "subscribe_button_edges" and self.arduino_manager.connected
+                and not self._arduino_subscribed):
+            response = await self._send_arduino_command("SUBSCRIBE")
+            if response != "OK":
                 raise Exception(f"Failed to subscribe to button events: {response}")
-        else:
-            raise Exception("Failed to send subscribe command to Arduino")
+            self._arduino_subscribed = True
+        
+        subscribers = self.tool_subscriptions.setdefault(tool_name, WeakSet())
+        if websocket in subscribers:
+            return
+        subscribers.add(websocket)
+        websocket.state.subscriptions.add(tool_name)
     
     async def _call_connect_arduino(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Call the connect_arduino tool."""
         port = params.get("port")
         
-        if self.arduino_manager.connect(port):
+        # Hold the command lock so no command is using the port while it is reopened.
+        # Connecting includes the ~2 s Arduino reset wait; keep it off the event loop
+        async with self._command_lock:
+            connected = await self.arduino_manager.connect_async(port)
+            if connected:
+                # A fresh connection resets the board, so it is not streaming yet
+                self._arduino_subscribed = False
+                self._reply_overdue = False
+                self._monitor_wakeup.set()
+                self._start_serial_reader()
+        
+        if connected:
             return {
                 "connected": True,
                 "message": f"Connected to Arduino on {self.arduino_manager.port_name}",
@@ -378,13 +521,90 @@ class MCPWebSocketServer:
     
     async def _call_disconnect_arduino(self) -> Dict[str, Any]:
         """Call the disconnect_arduino tool."""
-        self.arduino_manager.disconnect()
+        async with self._command_lock:
+            self.arduino_manager.disconnect()
+            self._arduino_subscribed = False
+            self._reply_overdue = False
+            self._monitor_wakeup.set()
         return {
             "disconnected": True,
             "message": "Disconnected from Arduino"
         }
     
-    async def _send_error(self, websocket: WebSocket, message: str, code: str, message_id: Optional[str] = None):
+    def _start_serial_reader(self) -> None:
+        """Start the serial reader task unless one is already running."""
+        if not self.monitoring_task or self.monitoring_task.done():
+            self.monitoring_task = asyncio.create_task(self._monitor_arduino_events())
+    
+    async def _check_arduino_health(self) -> bool:
+        """Check the Arduino connection like ArduinoConnectionManager.check_connection_health.
+        
+        The serial reader task owns the port, so the STATE heartbeat goes through
+        _send_arduino_command instead of the manager's own blocking probe.
+        """
+        manager = self.arduino_manager
+        port = manager.serial_port
+        if not manager.connected or port is None or not port.is_open:
+            return False
+        
+        if time.time() - manager.last_heartbeat <= manager.heartbeat_interval:
+            return True
+        
+        try:
+            response = await self._send_arduino_command("STATE", timeout=manager.probe_timeout)
+        except Exception as e:
+            logger.warning("Arduino heartbeat failed - command failed: %s", e)
+            return False
+        
+        if response and response.isdigit():
+            manager.last_heartbeat = time.time()
+            return True
+        
+        logger.warning("Arduino heartbeat failed - invalid response")
+        return False
+    
+    async def _send_arduino_command(self, command: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Send a command and wait for its reply from the serial reader task.
+        
+        Returns None if no reply arrives within timeout (the port timeout by default).
+        """
+        if timeout is None:
+            timeout = self.arduino_manager.timeout
+        matches = _REPLY_MATCHES.get(command)
+        
+        async with self._command_lock:
+            self._start_serial_reader()
+            self._monitor_wakeup.set()
+            
+            # The last command timed out, so its reply may still be on the way; give it
+            # one port timeout to turn up and discard it before sending this command
+            if self._reply_overdue:
+                self._reply_overdue = False
+                try:
+                    await asyncio.wait_for(self._replies.get(), timeout=self.arduino_manager.timeout)
+                except asyncio.TimeoutError:
+                    pass
+            
+            # Anything still queued answered an earlier command that timed out
+            while not self._replies.empty():
+                self._replies.get_nowait()
+            
+            # The write (and its flush) runs in a worker thread, like all serial I/O here
+            if not await self.arduino_manager.send_command_async(command):
+                raise Exception(f"Failed to send {command} command to Arduino")
+            
+            try:
+                async with asyncio.timeout(timeout):
+                    while True:
+                        reply = await self._replies.get()
+                        if matches is None or matches(reply):
+                            return reply
+                        logger.debug("Discarding stale Arduino reply %r to %s", reply, command)
+            except asyncio.TimeoutError:
+                self._reply_overdue = True
+                return None
+    
+    async def _send_error(self, websocket: WebSocket, message: str, code: str, message_id: MessageId = None) -> None:
         """Send an error response."""
         error_response = {
             "jsonrpc": "2.0",
@@ -397,62 +617,115 @@ class MCPWebSocketServer:
                 }
             }
         }
-        await websocket.send_text(json.dumps(error_response))
+        await websocket.send_bytes(_dumps(error_response))
     
-    async def _monitor_arduino_events(self):
-        """Monitor Arduino for button events and send notifications."""
+    async def _monitor_arduino_events(self) -> None:
+        """Read the Arduino serial stream and route each line as it arrives.
+        
+        Edge lines become button notifications; any other line is a command reply.
+        The blocking reads run in a worker thread, and before the board is streaming
+        the task waits on an event between commands, so nothing polls while idle.
+        """
         logger.info("Starting Arduino event monitoring")
+        loop = asyncio.get_running_loop()
+        manager = self.arduino_manager
         
         try:
+            # Edges set aside by the manager's own reads, e.g. during connect
+            lines = list(manager.pending_events)
+            manager.pending_events.clear()
+            
             while True:
-                if not self.arduino_manager.connected:
-                    await asyncio.sleep(1)
-                    continue
+                events: List[Tuple[str, float]] = []
+                # Lines from one drain arrived together; stamp them all with one clock read
+                now = time.time()
+                for line in lines:
+                    if line in EDGE_EVENTS:
+                        events.append((line, now))
+                    elif line:
+                        self._replies.put_nowait(line)
                 
-                # Check if we have any subscribers
-                if not self.tool_subscriptions.get("subscribe_button_edges"):
-                    await asyncio.sleep(1)
-                    continue
+                # Edges read while nobody is subscribed are dropped, not queued
+                if events and self.tool_subscriptions.get("subscribe_button_edges"):
+                    await self._notify_button_events(events)
                 
-                # Read all available serial data
-                while self.arduino_manager.serial_port and self.arduino_manager.serial_port.in_waiting > 0:
-                    try:
-                        line = self.arduino_manager.serial_port.readline().decode().strip()
-                        if line in ["RISING", "FALLING"]:
-                            await self._notify_button_event(line)
-                    except Exception as e:
-                        logger.error(f"Error reading Arduino event: {e}")
+                if not manager.connected:
+                    break
                 
-                await asyncio.sleep(0.05)  # Check every 50ms
+                # Nothing unsolicited arrives until SUBSCRIBE, so with no command in
+                # flight the reader parks here instead of waking on every port timeout
+                if not self._arduino_subscribed and not self._command_lock.locked():
+                    self._monitor_wakeup.clear()
+                    await self._monitor_wakeup.wait()
+                    lines = []
+                    continue
+                
+                # Returns as soon as a line arrives, or empty after the port timeout
+                port = manager.serial_port
+                try:
+                    lines = await loop.run_in_executor(None, manager.read_lines)
+                except Exception:
+                    # The port was closed or replaced under the read; carry on with the current one
+                    if manager.serial_port is not port:
+                        lines = []
+                        continue
+                    raise
                 
         except asyncio.CancelledError:
             logger.info("Arduino event monitoring cancelled")
         except Exception as e:
-            logger.error(f"Error in Arduino event monitoring: {e}")
+            # Closing the port under a pending read is the normal way disconnect ends it
+            if manager.connected:
+                logger.error(f"Error in Arduino event monitoring: {e}")
+        
+        logger.info("Arduino event monitoring stopped")
     
-    async def _notify_button_event(self, event_type: str):
-        """Notify subscribers of button events."""
-        notification = {
-            "jsonrpc": "2.0",
-            "method": "button_event",
-            "params": {
-                "event": event_type,
-                "timestamp": time.time()
+    async def _notify_button_events(self, events: List[Tuple[str, float]]) -> None:
+        """Notify subscribers of button events.
+        
+        A single edge goes out as button_event; several edges read in the same pass
+        are merged into one button_events notification carrying them in order.
+        """
+        if len(events) == 1:
+            event_type, timestamp = events[0]
+            notification = {
+                "jsonrpc": "2.0",
+                "method": "button_event",
+                "params": {
+                    "event": event_type,
+                    "timestamp": timestamp
+                }
+            }
+        else:
+            notification = {
+                "jsonrpc": "2.0",
+                "method": "button_events",
+                "params": {
+                    "events": [
+                        {"event": event_type, "timestamp": timestamp}
+                        for event_type, timestamp in events
+                    ]
+                }
             }
-        }
         
-        logger.info(f"🔔 Sending button event notification: {event_type}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔔 Sending button event notification: %s", ", ".join(event for event, _ in events))
         
         # Notify tool subscribers
         if "subscribe_button_edges" in self.tool_subscriptions:
-            subscriber_count = len(self.tool_subscriptions["subscribe_button_edges"])
-            logger.info(f"📡 Notifying {subscriber_count} tool subscribers")
-            for websocket in self.tool_subscriptions["subscribe_button_edges"]:
+            # Snapshot the subscribers; a full queue removes one from the set
+            subscribers = list(self.tool_subscriptions["subscribe_button_edges"])
+            logger.debug("📡 Notifying %d tool subscribers", len(subscribers))
+            
+            # Serialize once; every client's writer sends the same bytes object
+            payload = _dumps(notification)
+            for websocket in subscribers:
                 try:
-                    await websocket.send_text(json.dumps(notification))
-                    logger.debug(f"✅ Notification sent to tool subscriber {id(websocket)}")
-                except Exception as e:
-                    logger.error(f"❌ Failed to send notification to tool subscriber: {e}")
+                    websocket.state.out_queue.put_nowait(payload)
+                except asyncio.QueueFull:
+                    logger.warning(f"⚠️ Dropping tool subscriber {id(websocket)}: notification queue full")
+                    self._remove_subscriber(websocket)
+                    websocket.state.closing = asyncio.create_task(websocket.close(code=1013))
         else:
             logger.warning("⚠️ No tool subscribers for button events")
     
@@ -460,10 +733,16 @@ class MCPWebSocketServer:
         """Start the MCP WebSocket server."""
         logger.info(f"Starting MCP WebSocket Server on {host}:{port}")
         
+        # On PyPy stay on the pure-Python stack: stock asyncio loop and h11 for HTTP
         config = uvicorn.Config(
             self.app,
             host=host,
             port=port,
+            loop="uvloop" if _HAVE_UVLOOP and not _ON_PYPY else "asyncio",
+            http="h11" if _ON_PYPY else "auto",
+            ws="websockets",
+            # MCP frames are tiny JSON messages: compressing them costs more CPU than it saves
+            ws_per_message_deflate=False,
             log_level="info"
         )
         
@@ -476,4 +755,13 @@ async def main():
     await server.start()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    # serve() runs on the caller's loop, so pick uvloop here rather than in the config
+    if _HAVE_UVLOOP and not _ON_PYPY:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        asyncio.run(main())